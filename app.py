@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
 import re
-from utils.data_handler import load_data, add_item, export_library, import_library, save_blueprint, add_to_history
-from utils.ui_components import render_style_injection, render_component_card, render_add_form
+from utils.data_handler import load_data, get_data_version, add_item, export_library, import_library, save_blueprint, add_to_history
+from utils.ui_components import render_style_injection, render_component_card, render_add_form, render_bulk_actions, reserve_card_cache
 from utils.analytics import get_library_stats
+from utils.view_models import get_view_model, filter_ids
 
 # Page Config
 st.set_page_config(
@@ -110,15 +111,19 @@ def render_crud_interface(data_type_label: str):
     st.markdown("---")
     
     # 2. List Existing Items
+    # Read the version before loading so cached cards can never outlive a write
+    data_version = get_data_version(data_type)
     items = load_data(data_type)
     
     if not items:
         st.info(f"No {data_type.replace('_', ' ')} found. Add one above!")
     else:
         st.subheader(f"Existing {data_type_label.replace('_', ' ')} ({len(items)})")
+        render_bulk_actions(items, data_type)
+        reserve_card_cache(len(items))
         # Display in a grid or list
         for item in items:
-            render_component_card(item, data_type)
+            render_component_card(item, data_type, data_version)
 
 def render_library_page():
     """Page for importing and exporting the library."""
@@ -152,35 +157,29 @@ def render_assembler():
     """The main interface to build prompts."""
     st.title("Prompt Assembler 🛠️")
     
-    # Load all data
-    roles = load_data("roles")
-    goals = load_data("goals")
-    context = load_data("context")
-    outputs = load_data("output")
-
-    # Sort by favorites (favorites first)
-    sort_key = lambda x: not x.get('is_favorite', False)
-    roles = sorted(roles, key=sort_key)
-    goals = sorted(goals, key=sort_key)
-    context = sorted(context, key=sort_key)
-    outputs = sorted(outputs, key=sort_key)
+    # Precomputed, favorite-sorted views; only rebuilt when a data file changes
+    roles_vm = get_view_model("roles")
+    goals_vm = get_view_model("goals")
+    context_vm = get_view_model("context")
+    outputs_vm = get_view_model("output")
 
     # --- Blueprints (Recipes) ---
     blueprints = load_data("blueprints")
-    
-    # Helper to find index by ID
-    def get_index_by_id(items, item_id):
-        for idx, item in enumerate(items):
-            if item['id'] == item_id:
-                return idx
-        return None
 
-    # State for selections
+    # State for selections (widgets work on item ids)
     if 'role_select' not in st.session_state: st.session_state.role_select = None
     if 'goal_select' not in st.session_state: st.session_state.goal_select = None
     if 'output_select' not in st.session_state: st.session_state.output_select = None
     if 'context_select' not in st.session_state: st.session_state.context_select = []
 
+    # Drop selections whose items were deleted since the last run
+    for key, vm in [("role_select", roles_vm), ("goal_select", goals_vm), ("output_select", outputs_vm)]:
+        if st.session_state[key] is not None and st.session_state[key] not in vm["items"]:
+            st.session_state[key] = None
+    live_context = [i for i in st.session_state.context_select if i in context_vm["items"]]
+    if len(live_context) != len(st.session_state.context_select):
+        st.session_state.context_select = live_context
+
     col_bp, col_btn = st.columns([3, 1])
     with col_bp:
         selected_bp = st.selectbox(
@@ -196,22 +195,18 @@ def render_assembler():
         st.write("") 
         if st.button("Load", use_container_width=True):
             if selected_bp:
-                # Find matching items by ID to ensure we have the correct object reference
-                found_role = next((i for i in roles if i['id'] == selected_bp['role_id']), None)
-                found_goal = next((i for i in goals if i['id'] == selected_bp['goal_id']), None)
-                found_output = next((i for i in outputs if i['id'] == selected_bp['output_id']), None)
-                found_context = [i for i in context if i['id'] in selected_bp['context_ids']]
-                
-                st.session_state.role_select = found_role
-                st.session_state.goal_select = found_goal
-                st.session_state.output_select = found_output
-                st.session_state.context_select = found_context
+                # Only keep IDs that still exist in the library
+                st.session_state.role_select = selected_bp['role_id'] if selected_bp['role_id'] in roles_vm["items"] else None
+                st.session_state.goal_select = selected_bp['goal_id'] if selected_bp['goal_id'] in goals_vm["items"] else None
+                st.session_state.output_select = selected_bp['output_id'] if selected_bp['output_id'] in outputs_vm["items"] else None
+                bp_context_ids = set(selected_bp['context_ids'])
+                st.session_state.context_select = [i for i in context_vm["order"] if i in bp_context_ids]
                 
                 st.success(f"Loaded '{selected_bp['title']}'")
                 st.rerun()
 
     # --- Tag Filtering ---
-    sorted_tags = sorted(list({tag for cat in [roles, goals, context, outputs] for item in cat for tag in item.get('tags', [])}))
+    sorted_tags = sorted({tag for vm in [roles_vm, goals_vm, context_vm, outputs_vm] for tag in vm["tags"]})
     
     col1, col2 = st.columns([1, 1])
     
@@ -219,60 +214,60 @@ def render_assembler():
         st.subheader("Select Components")
         selected_tags = st.multiselect("Filter by Tags", options=sorted_tags)
         
-        def get_options(items, current_selection):
-            """Returns filtered items, ensuring current selection is always included."""
-            # Start with a copy or filtered list
-            if selected_tags:
-                filtered = [i for i in items if i.get('tags') and any(tag in selected_tags for tag in i['tags'])]
-            else:
-                filtered = list(items)
+        def get_options(vm, current_selection):
+            """Returns filtered item ids, ensuring current selection is always included."""
+            filtered = list(filter_ids(vm, selected_tags))
             
-            # Ensure the currently selected item is in the list (to avoid Streamlit errors)
-            # current_selection can be a single item or list (for multiselect)
-            if isinstance(current_selection, list):
-                for sel in current_selection:
-                    if sel and sel not in filtered:
-                        filtered.append(sel)
-            else:
-                if current_selection and current_selection not in filtered:
-                    filtered.append(current_selection)
+            # Ensure the currently selected ids are in the list (to avoid Streamlit errors)
+            # current_selection can be a single id or list of ids (for multiselect)
+            selection = current_selection if isinstance(current_selection, list) else [current_selection]
+            present = set(filtered)
+            for sel in selection:
+                if sel and sel not in present:
+                    filtered.append(sel)
+                    present.add(sel)
             
             return filtered
 
-        selected_role = st.selectbox(
+        selected_role_id = st.selectbox(
             "Role", 
-            options=get_options(roles, st.session_state.role_select), 
-            format_func=lambda x: f"{'⭐ ' if x.get('is_favorite') else ''}{x['title']}",
+            options=get_options(roles_vm, st.session_state.role_select), 
+            format_func=roles_vm["labels"].__getitem__,
             placeholder="Select a Role...",
             key="role_select",
             index=None
         )
         
-        selected_goal = st.selectbox(
+        selected_goal_id = st.selectbox(
             "Goal", 
-            options=get_options(goals, st.session_state.goal_select), 
-            format_func=lambda x: f"{'⭐ ' if x.get('is_favorite') else ''}{x['title']}",
+            options=get_options(goals_vm, st.session_state.goal_select), 
+            format_func=goals_vm["labels"].__getitem__,
             placeholder="Select a Goal...",
             key="goal_select",
             index=None
         )
         
-        selected_context = st.multiselect(
+        selected_context_ids = st.multiselect(
             "Context", 
-            options=get_options(context, st.session_state.context_select), 
-            format_func=lambda x: f"{'⭐ ' if x.get('is_favorite') else ''}{x['title']}",
+            options=get_options(context_vm, st.session_state.context_select), 
+            format_func=context_vm["labels"].__getitem__,
             key="context_select",
             default=None 
         )
         
-        selected_output = st.selectbox(
+        selected_output_id = st.selectbox(
             "Output Format", 
-            options=get_options(outputs, st.session_state.output_select), 
-            format_func=lambda x: f"{'⭐ ' if x.get('is_favorite') else ''}{x['title']}",
+            options=get_options(outputs_vm, st.session_state.output_select), 
+            format_func=outputs_vm["labels"].__getitem__,
             placeholder="Select Output format...",
             key="output_select",
             index=None
         )
+
+        selected_role = roles_vm["items"].get(selected_role_id)
+        selected_goal = goals_vm["items"].get(selected_goal_id)
+        selected_context = [context_vm["items"][i] for i in selected_context_ids]
+        selected_output = outputs_vm["items"].get(selected_output_id)
         
         custom_instructions = st.text_area("Additional Instructions", height=100)
 
@@ -395,8 +390,10 @@ def render_search_results(query: str):
     query = query.lower()
     
     found_any = False
+    cards_shown = 0
     
     for dtype in ["roles", "goals", "context", "output", "saved_prompts"]:
+        data_version = get_data_version(dtype)
         items = load_data(dtype)
         matching = [
             i for i in items 
@@ -408,8 +405,11 @@ def render_search_results(query: str):
         if matching:
             found_any = True
             st.subheader(dtype.replace("_", " ").title())
+            # Results span several types, so size the cache for the whole page
+            cards_shown += len(matching)
+            reserve_card_cache(cards_shown)
             for item in matching:
-                render_component_card(item, dtype)
+                render_component_card(item, dtype, data_version)
     
     if not found_any:
         st.warning("No matches found.")
@@ -0,0 +1,88 @@
+"""Measures component card HTML rendering throughput with and without memoization.
+
+Run from the project root:
+    python -m benchmarks.bench_card_render [count] [reruns]
+
+With no arguments it reports a page below and a page above the default
+cache size.
+"""
+import json
+import random
+import sys
+import time
+
+from utils.card_cache import CardCache, build_card_html
+
+REPEATS = 5
+
+TAG_POOL = ["officer", "tactical", "admin", "training", "logistics", "sop", "range", "safety", "fitness", "leadership"]
+
+def make_items(count: int) -> list:
+    """Builds synthetic components with realistic content length."""
+    rng = random.Random(0)
+    return [
+        {
+            "id": f"item-{n}",
+            "title": f"Component {n}",
+            "content": " ".join(rng.choice(TAG_POOL) for _ in range(80)),
+            "tags": rng.sample(TAG_POOL, 3),
+            "is_favorite": n % 10 == 0
+        }
+        for n in range(count)
+    ]
+
+def run(render, raw: str, reruns: int, write_each_rerun: bool = False) -> float:
+    """Renders every card once per rerun and returns cards rendered per second.
+
+    Each rerun gets freshly decoded items, as load_data() returns, but decoding
+    happens outside the timed section so only rendering is measured. With
+    ``write_each_rerun``, one item is starred per rerun and the data version
+    changes, as it does after a card's Star button.
+    """
+    batches = []
+    for rerun in range(reruns):
+        items = json.loads(raw)
+        data_version = (0, 0, 0)
+        if write_each_rerun:
+            items[rerun % len(items)]["is_favorite"] = True
+            data_version = (rerun, 0, 0)
+        batches.append((items, data_version))
+
+    total = 0
+    start = time.perf_counter()
+    for items, data_version in batches:
+        for item in items:
+            render(item, data_version)
+            total += 1
+    return total / (time.perf_counter() - start)
+
+def best(render, raw: str, reruns: int, write_each_rerun: bool = False) -> float:
+    """Best of several runs to smooth out GC and scheduler noise."""
+    return max(run(render, raw, reruns, write_each_rerun) for _ in range(REPEATS))
+
+def main():
+    counts = [int(sys.argv[1])] if len(sys.argv) > 1 else [500, 2000]
+    reruns = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    for count in counts:
+        raw = json.dumps(make_items(count))
+
+        # Production default size; the pages call reserve() with their card count
+        sized = CardCache()
+        sized.reserve(count)
+        unsized = CardCache()
+
+        uncached = best(lambda item, version: build_card_html(item), raw, reruns)
+        memoized = best(lambda item, version: sized.get_html(item, "roles", version), raw, reruns)
+        written = best(lambda item, version: sized.get_html(item, "roles", version), raw, reruns, write_each_rerun=True)
+        no_reserve = best(lambda item, version: unsized.get_html(item, "roles", version), raw, reruns)
+
+        print(f"cards:                  {count} x {reruns} reruns (default cache size {unsized.max_size})")
+        print(f"uncached:               {uncached:12,.0f} cards/s")
+        print(f"memoized:               {memoized:12,.0f} cards/s  ({memoized / uncached:.2f} x)")
+        print(f"memoized, 1 write/run:  {written:12,.0f} cards/s  ({written / uncached:.2f} x)")
+        print(f"memoized, no reserve(): {no_reserve:12,.0f} cards/s  ({no_reserve / uncached:.2f} x)")
+        print()
+
+if __name__ == "__main__":
+    main()
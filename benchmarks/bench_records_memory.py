@@ -0,0 +1,78 @@
+"""Compares memory use and load time of plain dicts vs. typed records for library data.
+
+Run from the project root:
+    python -m benchmarks.bench_records_memory [count]
+"""
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+from utils.records import to_records
+
+TAG_POOL = ["officer", "tactical", "admin", "training", "logistics", "sop", "range", "safety", "fitness", "leadership"]
+
+def make_items(count: int) -> list:
+    """Builds synthetic saved prompts, round-tripped through JSON like load_data()."""
+    rng = random.Random(0)
+    items = []
+    for n in range(count):
+        item = {
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "title": f"Prompt {n}",
+            "content": f"You are an instructor. Prepare lesson {n} on {rng.choice(TAG_POOL)}.",
+            "tags": rng.sample(TAG_POOL, 3),
+            "is_favorite": n % 10 == 0
+        }
+        if n % 5 == 0:
+            item["versions"] = [
+                {"timestamp": datetime(2024, 1, 1).isoformat(), "content": f"Old lesson {n}"}
+            ]
+        items.append(item)
+    # Round-trip so every key and tag is a fresh string, as it is after json.load
+    return json.loads(json.dumps(items))
+
+def measure(build) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+def time_load(build, repeats: int = 3) -> float:
+    """Returns the best wall-clock time of several builds, outside tracemalloc."""
+    best = float("inf")
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    raw = json.dumps(make_items(count))
+
+    dicts, dict_bytes = measure(lambda: json.loads(raw))
+    del dicts
+    records, record_bytes = measure(lambda: to_records("saved_prompts", json.loads(raw)))
+    del records
+
+    # Records re-encode versions on construction, so loading costs extra CPU
+    dict_secs = time_load(lambda: json.loads(raw))
+    record_secs = time_load(lambda: to_records("saved_prompts", json.loads(raw)))
+
+    print(f"items:   {count}")
+    print(f"dicts:   {dict_bytes / 2**20:8.1f} MiB ({dict_bytes / count:6.0f} B/item)")
+    print(f"records: {record_bytes / 2**20:8.1f} MiB ({record_bytes / count:6.0f} B/item)")
+    print(f"saved:   {100 * (1 - record_bytes / dict_bytes):8.1f} %")
+    print(f"load (dicts):   {dict_secs * 1000:8.1f} ms")
+    print(f"load (records): {record_secs * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from typing import Dict, Hashable
+
+# Upper bound on cached cards per session
+CARD_CACHE_SIZE = 512
+
+TAG_STYLE = "background-color:#e9ecef; padding:2px 6px; border-radius:10px; font-size:0.8em; margin-right:5px;"
+
+def build_card_html(item: Dict) -> str:
+    """Builds the markup for a component card."""
+    tags_html = ""
+    if item.get('tags'):
+        spans = " ".join([f"<span style='{TAG_STYLE}'>{tag}</span>" for tag in item['tags']])
+        tags_html = f'<div style="margin-top:5px;">{spans}</div>'
+
+    return f"""
+        <div class="prompt-card">
+            <div style="display:flex; justify-content:space-between; align-items:center;">
+                <h4 style="margin:0;">{item['title']} {'⭐' if item.get('is_favorite') else ''}</h4>
+            </div>
+            {tags_html}
+            <div class="content">{item['content']}</div>
+        </div>
+        """
+
+def card_revision(item: Dict) -> int:
+    """Returns a hash of the fields a card renders, used as the item's revision."""
+    return hash((item['title'], item['content'], tuple(item.get('tags') or ()), bool(item.get('is_favorite'))))
+
+class CardCache:
+    """Bounded LRU cache of rendered card HTML, one entry per item.
+
+    Each entry remembers the data version it was last validated against and
+    the item's revision hash. While the data version is unchanged a hit is a
+    plain key lookup; after a write, only cards whose revision changed are
+    rebuilt.
+    """
+
+    def __init__(self, max_size: int = CARD_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def reserve(self, count: int) -> None:
+        """Grows the cache so a page of ``count`` cards can't evict itself."""
+        self.max_size = max(self.max_size, count)
+
+    def get_html(self, item: Dict, data_type: str, data_version: Hashable) -> str:
+        """Returns cached card HTML, rebuilding it only if the item changed."""
+        # Card markup doesn't vary by theme (styling comes from the injected CSS),
+        # so the theme is deliberately not part of the key.
+        key = (data_type, item['id'])
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] == data_version:
+                self._entries.move_to_end(key)
+                return entry[2]
+            revision = card_revision(item)
+            if entry[1] == revision:
+                self._entries[key] = (data_version, revision, entry[2])
+                self._entries.move_to_end(key)
+                return entry[2]
+        else:
+            revision = card_revision(item)
+
+        html = build_card_html(item)
+        self._entries[key] = (data_version, revision, html)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return html
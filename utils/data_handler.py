@@ -1,15 +1,68 @@
 import json
 import os
+import stat
+import tempfile
+import time
 import uuid
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from typing import List, Dict, Iterator, Optional
 from datetime import datetime
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 
+# Per-type write counters, bumped on every save so caches can tell a file
+# changed even when the filesystem mtime resolution is too coarse.
+_write_counters: Dict[str, int] = {}
+
+# On Windows, os.replace() fails with a sharing violation while another
+# session has the file open for reading, so the swap is retried briefly.
+_WINDOWS_SHARING_ERRORS = (5, 32)  # ERROR_ACCESS_DENIED, ERROR_SHARING_VIOLATION
+_REPLACE_RETRIES = 5
+_REPLACE_RETRY_DELAY = 0.05
+
 def _get_file_path(data_type: str) -> str:
     """Returns the absolute path for the given data type's JSON file."""
     return os.path.join(DATA_DIR, f"{data_type}.json")
 
+def _create_temp_file(file_path: str, data_type: str) -> tuple:
+    """Creates the temp file for save_data() with the target file's permissions."""
+    directory = os.path.dirname(file_path)
+    try:
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        # No file to copy from: let the kernel apply the umask to 0666
+        tmp_path = os.path.join(directory, f".{data_type}.{uuid.uuid4().hex}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        return fd, tmp_path
+
+    # mkstemp creates 0600 files; keep the existing file's permissions instead
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{data_type}.", suffix=".tmp")
+    try:
+        os.chmod(tmp_path, mode)
+    except BaseException:
+        os.close(fd)
+        os.remove(tmp_path)
+        raise
+    return fd, tmp_path
+
+def _replace_file(tmp_path: str, file_path: str) -> None:
+    """Swaps the temp file into place, retrying Windows sharing violations."""
+    for attempt in range(_REPLACE_RETRIES):
+        try:
+            os.replace(tmp_path, file_path)
+            return
+        except PermissionError as e:
+            is_sharing_violation = os.name == 'nt' and getattr(e, 'winerror', None) in _WINDOWS_SHARING_ERRORS
+            if not is_sharing_violation or attempt == _REPLACE_RETRIES - 1:
+                raise
+            time.sleep(_REPLACE_RETRY_DELAY * (attempt + 1))
+
+def _json_default(obj):
+    """Serializes dict-compatible records (see utils/records.py) as plain dicts."""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def load_data(data_type: str) -> List[Dict]:
     """Loads data from the specified JSON file."""
     file_path = _get_file_path(data_type)
@@ -23,86 +76,175 @@ def load_data(data_type: str) -> List[Dict]:
         return []
 
 def save_data(data_type: str, data: List[Dict]) -> None:
-    """Saves data to the specified JSON file."""
+    """Saves data to the specified JSON file.
+
+    Writes to a temporary file first and swaps it in, so readers never see a
+    partially written file.
+    """
     file_path = _get_file_path(data_type)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    fd, tmp_path = _create_temp_file(file_path, data_type)
+    try:
+        try:
+            f = os.fdopen(fd, 'w', encoding='utf-8')
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            json.dump(data, f, indent=2, default=_json_default)
+        _replace_file(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _write_counters[data_type] = _write_counters.get(data_type, 0) + 1
 
-def add_item(data_type: str, title: str, content: str, tags: list = None, is_favorite: bool = False) -> Dict:
-    """Adds a new item to the storage."""
-    data = load_data(data_type)
-    new_item = {
-        "id": str(uuid.uuid4()),
-        "title": title,
-        "content": content,
-        "tags": tags or [],
-        "is_favorite": is_favorite
-    }
-    data.append(new_item)
-    save_data(data_type, data)
-    return new_item
+def get_data_version(data_type: str) -> tuple:
+    """Returns a cheap token that changes whenever the data type's file changes."""
+    file_path = _get_file_path(data_type)
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return (_write_counters.get(data_type, 0), None, None)
+    return (_write_counters.get(data_type, 0), file_stat.st_mtime_ns, file_stat.st_size)
 
-def update_item(data_type: str, item_id: str, title: str, content: str, tags: list = None, create_version: bool = False) -> bool:
-    """Updates an existing item, optionally creating a version history entry."""
-    data = load_data(data_type)
-    for item in data:
-        if item['id'] == item_id:
-            # Handle versioning for saved prompts
-            if create_version and data_type == "saved_prompts":
-                if 'versions' not in item:
-                    item['versions'] = []
-                
-                # archive current state
-                item['versions'].append({
-                    "timestamp": datetime.now().isoformat(),
-                    "content": item['content']
-                })
-
-            item['title'] = title
-            item['content'] = content
-            if tags is not None:
-                item['tags'] = tags
-            save_data(data_type, data)
-            return True
-    return False
+# --- Transactions ---
+class DataTransaction:
+    """Batches item mutations against one loaded snapshot of a data type.
+
+    Changes are applied in memory and written with a single atomic save on
+    commit(), so bulk operations cost one load and one write in total.
+    """
+
+    def __init__(self, data_type: str):
+        self.data_type = data_type
+        self._data = load_data(data_type)
+        self._by_id = {}
+        for item in self._data:
+            self._by_id.setdefault(item['id'], item)
+        self._deleted = set()
+        self._dirty = False
+
+    def get(self, item_id: str) -> Optional[Dict]:
+        """Returns the live item for an ID, or None if missing or deleted."""
+        return self._by_id.get(item_id)
+
+    def add_item(self, title: str, content: str, tags: list = None, is_favorite: bool = False) -> Dict:
+        """Adds a new item to the snapshot."""
+        new_item = {
+            "id": str(uuid.uuid4()),
+            "title": title,
+            "content": content,
+            "tags": tags or [],
+            "is_favorite": is_favorite
+        }
+        self._data.append(new_item)
+        self._by_id[new_item['id']] = new_item
+        self._dirty = True
+        return new_item
+
+    def update_item(self, item_id: str, title: str, content: str, tags: list = None, create_version: bool = False) -> bool:
+        """Updates an existing item, optionally creating a version history entry."""
+        item = self._by_id.get(item_id)
+        if item is None:
+            return False
+
+        # Handle versioning for saved prompts
+        if create_version and self.data_type == "saved_prompts":
+            if 'versions' not in item:
+                item['versions'] = []
+
+            # archive current state
+            item['versions'].append({
+                "timestamp": datetime.now().isoformat(),
+                "content": item['content']
+            })
+
+        item['title'] = title
+        item['content'] = content
+        if tags is not None:
+            item['tags'] = tags
+        self._dirty = True
+        return True
+
+    def duplicate_item(self, item_id: str, new_title_suffix: str = " (Copy)") -> bool:
+        """Duplicates an existing item with a new ID."""
+        original = self._by_id.get(item_id)
+        if original is None:
+            return False
 
-def duplicate_item(data_type: str, item_id: str, new_title_suffix: str = " (Copy)") -> bool:
-    """Duplicates an existing item with a new ID."""
-    data = load_data(data_type)
-    original = next((i for i in data if i['id'] == item_id), None)
-    
-    if original:
         new_item = original.copy()
         new_item['id'] = str(uuid.uuid4())
         new_item['title'] = original['title'] + new_title_suffix
         new_item['is_favorite'] = False # Reset favorite status
-        
+
         # Insert after original for better UX? Or append? Append is simpler.
-        data.append(new_item)
-        save_data(data_type, data)
+        self._data.append(new_item)
+        self._by_id[new_item['id']] = new_item
+        self._dirty = True
+        return True
+
+    def delete_item(self, item_id: str) -> bool:
+        """Deletes an item by ID."""
+        if self._by_id.pop(item_id, None) is None:
+            return False
+        # Removal from the list is deferred to commit() to keep deletes O(1)
+        self._deleted.add(item_id)
+        self._dirty = True
         return True
-    return False
+
+    def toggle_favorite(self, item_id: str) -> bool:
+        """Toggles the favorite status of an item."""
+        item = self._by_id.get(item_id)
+        if item is None:
+            return False
+        item['is_favorite'] = not item.get('is_favorite', False)
+        self._dirty = True
+        return True
+
+    def commit(self) -> None:
+        """Writes the snapshot back if anything changed."""
+        if not self._dirty:
+            return
+        if self._deleted:
+            self._data = [item for item in self._data if item['id'] not in self._deleted]
+            self._deleted = set()
+        save_data(self.data_type, self._data)
+        self._dirty = False
+
+@contextmanager
+def transaction(data_type: str) -> Iterator[DataTransaction]:
+    """Context manager that commits all batched mutations with one write.
+
+    If the block raises, nothing is written.
+    """
+    tx = DataTransaction(data_type)
+    yield tx
+    tx.commit()
+
+def add_item(data_type: str, title: str, content: str, tags: list = None, is_favorite: bool = False) -> Dict:
+    """Adds a new item to the storage."""
+    with transaction(data_type) as tx:
+        return tx.add_item(title, content, tags, is_favorite)
+
+def update_item(data_type: str, item_id: str, title: str, content: str, tags: list = None, create_version: bool = False) -> bool:
+    """Updates an existing item, optionally creating a version history entry."""
+    with transaction(data_type) as tx:
+        return tx.update_item(item_id, title, content, tags, create_version=create_version)
+
+def duplicate_item(data_type: str, item_id: str, new_title_suffix: str = " (Copy)") -> bool:
+    """Duplicates an existing item with a new ID."""
+    with transaction(data_type) as tx:
+        return tx.duplicate_item(item_id, new_title_suffix)
 
 def delete_item(data_type: str, item_id: str) -> bool:
     """Deletes an item by ID."""
-    data = load_data(data_type)
-    original_len = len(data)
-    data = [item for item in data if item['id'] != item_id]
-    
-    if len(data) < original_len:
-        save_data(data_type, data)
-        return True
-    return False
+    with transaction(data_type) as tx:
+        return tx.delete_item(item_id)
 
 def toggle_favorite(data_type: str, item_id: str) -> bool:
     """Toggles the favorite status of an item."""
-    data = load_data(data_type)
-    for item in data:
-        if item['id'] == item_id:
-            item['is_favorite'] = not item.get('is_favorite', False)
-            save_data(data_type, data)
-            return True
-    return False
+    with transaction(data_type) as tx:
+        return tx.toggle_favorite(item_id)
 
 # --- Blueprints ---
 def save_blueprint(title: str, role_id: str, goal_id: str, context_ids: List[str], output_id: str) -> None:
@@ -157,7 +299,7 @@ def export_library() -> str:
     library = {}
     for dtype in ["roles", "goals", "context", "output", "saved_prompts"]:
         library[dtype] = load_data(dtype)
-    return json.dumps(library, indent=2)
+    return json.dumps(library, indent=2, default=_json_default)
 
 def import_library(json_data: str, merge: bool = True) -> bool:
     """Imports data from a JSON string."""
@@ -0,0 +1,184 @@
+import json
+import sys
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Iterator, List
+from utils.data_handler import load_data, save_data
+
+class _Record(MutableMapping):
+    """Slotted, dict-compatible base for in-memory library records.
+
+    Keys map onto slots; a slot that was never set behaves like a missing key,
+    so records round-trip to the same JSON shape they were loaded from.
+    Unknown keys (e.g. from imported libraries) are kept in a small overflow dict.
+    """
+    __slots__ = ("_extra",)
+    _fields: tuple = ()
+
+    def __init__(self, data: Dict = None, **kwargs):
+        self._extra = None
+        for key, value in {**(data or {}), **kwargs}.items():
+            self[key] = value
+
+    def _set_field(self, key: str, value: Any) -> None:
+        object.__setattr__(self, key, value)
+
+    def _get_field(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def _export_field(self, key: str) -> Any:
+        """Returns a field's value for serialization without changing the record."""
+        return getattr(self, key)
+
+    def _raw_items(self) -> Iterator:
+        """Yields (key, stored value) pairs, leaving lazily decoded slots encoded."""
+        for key in self._fields:
+            if hasattr(self, key):
+                yield key, getattr(self, key)
+        if self._extra is not None:
+            yield from self._extra.items()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            try:
+                return self._get_field(key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._fields:
+            self._set_field(key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._fields:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+            if not self._extra:
+                self._extra = None
+        else:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._fields:
+            if hasattr(self, key):
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _Record):
+            other = other.to_dict()
+        elif isinstance(other, Mapping):
+            other = dict(other)
+        else:
+            return NotImplemented
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def copy(self) -> "_Record":
+        """Returns a shallow copy, mirroring dict.copy()."""
+        return type(self)(dict(self._raw_items()))
+
+    def to_dict(self) -> Dict:
+        """Returns a plain dict suitable for JSON serialization.
+
+        save_data() and export_library() call this for records, but json.dumps()
+        on a record directly still needs ``default=`` or an explicit to_dict().
+        """
+        result = {key: self._export_field(key) for key in self._fields if hasattr(self, key)}
+        if self._extra is not None:
+            result.update(self._extra)
+        return result
+
+def _intern_all(values) -> list:
+    """Interns a list of strings so repeated tags/ids share one object."""
+    return [sys.intern(v) if isinstance(v, str) else v for v in values]
+
+class ItemRecord(_Record):
+    """A library component (role, goal, context, output or saved prompt).
+
+    Tags are stored as a list of interned strings, so they compare and mutate
+    like the plain dict's list. ``versions`` is lazily decoded: it is
+    re-encoded to compact JSON on construction and only parsed again on first
+    access, since it is only needed by the edit view. That trades extra CPU at
+    load time for memory; see benchmarks/bench_records_memory.py.
+    Serializing, copying or comparing a record decodes ``versions`` into the
+    output only; the slot stays encoded until it is read via ``record['versions']``.
+    """
+    __slots__ = ("id", "title", "content", "tags", "is_favorite", "versions")
+    _fields = __slots__
+
+    def _set_field(self, key: str, value: Any) -> None:
+        if key == "tags" and value is not None:
+            value = _intern_all(value)
+        elif key == "versions" and isinstance(value, list):
+            value = json.dumps(value, separators=(",", ":"))
+        object.__setattr__(self, key, value)
+
+    def _get_field(self, key: str) -> Any:
+        value = getattr(self, key)
+        if key == "versions" and isinstance(value, str):
+            # Decode once; callers may append to the returned list in place
+            value = json.loads(value)
+            object.__setattr__(self, key, value)
+        return value
+
+    def _export_field(self, key: str) -> Any:
+        value = getattr(self, key)
+        if key == "versions" and isinstance(value, str):
+            return json.loads(value)
+        return value
+
+class BlueprintRecord(_Record):
+    """A saved Assembler configuration referencing components by id."""
+    __slots__ = ("id", "title", "role_id", "goal_id", "context_ids", "output_id")
+    _fields = __slots__
+
+    def _set_field(self, key: str, value: Any) -> None:
+        if key == "context_ids" and value is not None:
+            value = _intern_all(value)
+        elif key in ("role_id", "goal_id", "output_id") and isinstance(value, str):
+            value = sys.intern(value)
+        object.__setattr__(self, key, value)
+
+class HistoryRecord(_Record):
+    """A generated prompt logged to history."""
+    __slots__ = ("id", "content", "timestamp")
+    _fields = __slots__
+
+def _record_class(data_type: str) -> type:
+    if data_type == "blueprints":
+        return BlueprintRecord
+    if data_type == "history":
+        return HistoryRecord
+    return ItemRecord
+
+def to_records(data_type: str, items: List[Dict]) -> List[_Record]:
+    """Converts plain dicts into the compact record type for the data type."""
+    record_class = _record_class(data_type)
+    return [record_class(item) for item in items]
+
+def load_records(data_type: str) -> List[_Record]:
+    """Loads data as compact typed records instead of plain dicts."""
+    return to_records(data_type, load_data(data_type))
+
+def save_records(data_type: str, records: List[Dict]) -> None:
+    """Saves records (or plain dicts) to the specified JSON file."""
+    save_data(data_type, records)
@@ -1,5 +1,7 @@
 import streamlit as st
-from utils.data_handler import add_item, update_item, delete_item, toggle_favorite, duplicate_item
+from utils.data_handler import add_item, update_item, delete_item, toggle_favorite, duplicate_item, transaction, get_data_version
+from utils.card_cache import CardCache
+from utils.view_models import format_label
 
 def render_style_injection(theme: str = "standard"):
     """Injects the custom CSS based on the selected theme."""
@@ -10,27 +12,32 @@ def render_style_injection(theme: str = "standard"):
     except FileNotFoundError:
         st.warning(f"Theme file {css_file} not found.")
 
-def render_component_card(item: dict, data_type: str):
-    """Renders a single component card with Edit/Delete options."""
+def _get_card_cache() -> CardCache:
+    """Returns this session's card HTML cache."""
+    if 'card_cache' not in st.session_state:
+        st.session_state.card_cache = CardCache()
+    return st.session_state.card_cache
+
+def reserve_card_cache(count: int):
+    """Sizes the card cache for a page of ``count`` cards before rendering it."""
+    _get_card_cache().reserve(count)
+
+def render_component_card(item: dict, data_type: str, data_version: tuple = None):
+    """Renders a single component card with Edit/Delete options.
+
+    Pass the data_version read before loading the items to skip a stat per card.
+    """
     
     # Unique key for state management
     card_key = f"card_{data_type}_{item['id']}"
     
     # We use a container to look like a card
     with st.container():
-        tags_html = ""
-        if item.get('tags'):
-            tags_html = f'<div style="margin-top:5px;">{" ".join([f"<span style='background-color:#e9ecef; padding:2px 6px; border-radius:10px; font-size:0.8em; margin-right:5px;'>{tag}</span>" for tag in item["tags"]])}</div>'
-            
-        st.markdown(f"""
-        <div class="prompt-card">
-            <div style="display:flex; justify-content:space-between; align-items:center;">
-                <h4 style="margin:0;">{item['title']} {'⭐' if item.get('is_favorite') else ''}</h4>
-            </div>
-            {tags_html}
-            <div class="content">{item['content']}</div>
-        </div>
-        """, unsafe_allow_html=True)
+        # Card markup is memoized per item revision for this session
+        if data_version is None:
+            data_version = get_data_version(data_type)
+        card_html = _get_card_cache().get_html(item, data_type, data_version)
+        st.markdown(card_html, unsafe_allow_html=True)
         
         col1, col2, col3, col4 = st.columns([1, 1, 1, 3])
         with col1:
@@ -105,3 +112,68 @@ def render_add_form(data_type: str):
                     st.rerun()
                 else:
                     st.error("Title and Content are required.")
+
+def render_bulk_actions(items: list, data_type: str):
+    """Renders multi-select bulk actions that are applied with a single write."""
+    select_key = f"bulk_select_{data_type}"
+    tags_key = f"bulk_tags_{data_type}"
+
+    # Widgets can't be reset after they render, so clear them on the run after an action
+    if st.session_state.pop(f"bulk_reset_{data_type}", False):
+        st.session_state.pop(select_key, None)
+        st.session_state.pop(tags_key, None)
+
+    # Short id suffix keeps items with the same title distinguishable
+    labels = {item['id']: f"{format_label(item)} ({item['id'][:8]})" for item in items}
+
+    # Drop ids removed since the last run (card Delete, another session, import)
+    # to avoid Streamlit errors, as the Assembler does for its selections
+    if select_key in st.session_state:
+        live_ids = [i for i in st.session_state[select_key] if i in labels]
+        if len(live_ids) != len(st.session_state[select_key]):
+            st.session_state[select_key] = live_ids
+
+    with st.expander("Bulk Actions", expanded=False):
+        selected_ids = st.multiselect(
+            "Select items",
+            options=list(labels),
+            format_func=labels.__getitem__,
+            key=select_key
+        )
+        tags_str = st.text_input("Tags to add (comma-separated)", key=tags_key)
+
+        col1, col2, col3, col4 = st.columns([1, 1, 1, 3])
+        delete_clicked = col1.button("Delete Selected", key=f"bulk_delete_{data_type}")
+        star_clicked = col2.button("Toggle Star", key=f"bulk_fav_{data_type}")
+        tag_clicked = col3.button("Add Tags", key=f"bulk_tag_{data_type}")
+
+        if not (delete_clicked or star_clicked or tag_clicked):
+            return
+        if not selected_ids:
+            st.error("Select at least one item.")
+            return
+
+        new_tags = list(dict.fromkeys(t.strip() for t in tags_str.split(",") if t.strip()))
+        if tag_clicked and not new_tags:
+            st.error("Enter at least one tag.")
+            return
+
+        try:
+            with transaction(data_type) as tx:
+                for item_id in selected_ids:
+                    if delete_clicked:
+                        tx.delete_item(item_id)
+                    elif star_clicked:
+                        tx.toggle_favorite(item_id)
+                    else:
+                        item = tx.get(item_id)
+                        if item is not None:
+                            merged = list(item.get('tags', [])) + [t for t in new_tags if t not in item.get('tags', [])]
+                            tx.update_item(item_id, item['title'], item['content'], merged)
+        except PermissionError:
+            # save_data already retried; the file is still locked by another session
+            st.error("The library file is busy. Please try again.")
+            return
+
+        st.session_state[f"bulk_reset_{data_type}"] = True
+        st.rerun()
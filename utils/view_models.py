@@ -0,0 +1,57 @@
+from typing import Dict, List, Set, Any
+from utils.data_handler import load_data, get_data_version
+
+# Cached view models keyed by data type. Each entry carries the data version
+# it was built from and is only rebuilt when that version changes.
+_view_models: Dict[str, Dict[str, Any]] = {}
+
+def format_label(item: Dict) -> str:
+    """Returns the display label used by selection widgets."""
+    return f"{'⭐ ' if item.get('is_favorite') else ''}{item['title']}"
+
+def _build_view_model(data_type: str, version: tuple) -> Dict[str, Any]:
+    """Builds the id-based view of a data type: order, labels and tag membership."""
+    items = load_data(data_type)
+
+    # Favorites first, otherwise keep file order (sorted() is stable)
+    ordered = sorted(items, key=lambda x: not x.get('is_favorite', False))
+
+    by_id = {}
+    labels = {}
+    tags: Dict[str, Set[str]] = {}
+    for item in ordered:
+        item_id = item['id']
+        by_id[item_id] = item
+        labels[item_id] = format_label(item)
+        for tag in item.get('tags') or []:
+            tags.setdefault(tag, set()).add(item_id)
+
+    return {
+        "version": version,
+        "order": [item['id'] for item in ordered],
+        "items": by_id,
+        "labels": labels,
+        "tags": tags
+    }
+
+def get_view_model(data_type: str) -> Dict[str, Any]:
+    """Returns the cached view model for a data type, rebuilding it if the data changed.
+
+    The returned structure is shared between reruns and must be treated as read-only.
+    """
+    version = get_data_version(data_type)
+    view_model = _view_models.get(data_type)
+    if view_model is None or view_model["version"] != version:
+        view_model = _build_view_model(data_type, version)
+        _view_models[data_type] = view_model
+    return view_model
+
+def filter_ids(view_model: Dict[str, Any], selected_tags: List[str]) -> List[str]:
+    """Returns ids in display order, restricted to items carrying any of the selected tags."""
+    if not selected_tags:
+        return view_model["order"]
+
+    matching = set()
+    for tag in selected_tags:
+        matching |= view_model["tags"].get(tag, set())
+    return [item_id for item_id in view_model["order"] if item_id in matching]